@@ -1,6 +1,8 @@
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import List
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -8,49 +10,53 @@ from covered_call import (
     OptionQuote,
     fetch_cash_secured_put_quotes,
     fetch_covered_call_quotes,
+    fetch_underlying_price,
     get_fetch_stats,
     list_option_expiries,
 )
 
 
 def quotes_to_dataframe(quotes: List[OptionQuote]) -> pd.DataFrame:
-    records = [
+    n = len(quotes)
+    expiry_dates = {quote.expiry for quote in quotes}
+    if len(expiry_dates) == 1:
+        # Quotes from a single fetch share one expiry; format it once.
+        expiry = pd.Categorical.from_codes(
+            np.zeros(n, dtype=np.int8), categories=[quotes[0].expiry.strftime("%Y-%m-%d")]
+        )
+    else:
+        expiry = pd.Categorical([quote.expiry.strftime("%Y-%m-%d") for quote in quotes])
+    return pd.DataFrame(
         {
-            **asdict(quote),
-            "expiry": quote.expiry.strftime("%Y-%m-%d"),
-        }
-        for quote in quotes
-    ]
-    df = pd.DataFrame(records)
-    numeric_cols = [
-        "strike",
-        "premium",
-        "underlying_price",
-        "apr",
-        "break_even_price",
-        "bid",
-        "ask",
-        "implied_vol",
-    ]
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-    return df
-
-
-def format_strike_with_percent(strike: float, underlying: float) -> str:
-    if underlying is None or underlying == 0:
-        return f"{strike:.2f}"
-    pct_diff = ((strike - underlying) / underlying) * 100
-    return f"{strike:.2f} ({pct_diff:.2f}%)"
-
-
-def _days_until(expiry: str) -> int:
-    from datetime import datetime, timezone
-
-    expiry_dt = datetime.strptime(expiry, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    today = datetime.now(timezone.utc).date()
-    return max((expiry_dt.date() - today).days, 0)
+            "ticker": pd.Categorical([quote.ticker for quote in quotes]),
+            "option_type": pd.Categorical([quote.option_type for quote in quotes]),
+            "expiry": expiry,
+            "strike": np.fromiter((quote.strike for quote in quotes), "float64", n),
+            "premium": np.fromiter((quote.premium for quote in quotes), "float64", n),
+            "underlying_price": np.fromiter(
+                (quote.underlying_price for quote in quotes), "float64", n
+            ),
+            "days_to_expiry": np.fromiter(
+                (quote.days_to_expiry for quote in quotes), "int32", n
+            ),
+            "apr": np.fromiter((quote.apr for quote in quotes), "float64", n),
+            "break_even_price": np.fromiter(
+                (quote.break_even_price for quote in quotes), "float64", n
+            ),
+            "bid": np.fromiter(
+                (np.nan if quote.bid is None else quote.bid for quote in quotes), "float64", n
+            ),
+            "ask": np.fromiter(
+                (np.nan if quote.ask is None else quote.ask for quote in quotes), "float64", n
+            ),
+            "implied_vol": np.fromiter(
+                (np.nan if quote.implied_vol is None else quote.implied_vol for quote in quotes),
+                "float64",
+                n,
+            ),
+        },
+        copy=False,
+    )
 
 
 def main() -> None:
@@ -81,12 +87,22 @@ def main() -> None:
         st.warning("No options expirations found. Check the symbol and try again.")
         return
 
+    today = datetime.now(timezone.utc).date()
+    expiry_dates = {
+        expiry: datetime.strptime(expiry, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        for expiry in expiries
+    }
+    days_by_expiry = {
+        expiry: max((expiry_dt.date() - today).days, 0)
+        for expiry, expiry_dt in expiry_dates.items()
+    }
+
     default_expiries = expiries[: min(3, len(expiries))]
     selected_expiries = st.multiselect(
         "Option expiries",
         options=expiries,
         default=default_expiries,
-        format_func=lambda expiry: f"{expiry} ({_days_until(expiry)} days)",
+        format_func=lambda expiry: f"{expiry} ({days_by_expiry[expiry]} days)",
     )
 
     if not selected_expiries:
@@ -100,24 +116,35 @@ def main() -> None:
     )
 
     with st.spinner("Fetching option chain…"):
-        quotes_by_expiry = {
-            expiry: fetch_fn(symbol, expiry) for expiry in selected_expiries
-        }
+        underlying_price = fetch_underlying_price(symbol)
+        if underlying_price is None or underlying_price <= 0:
+            st.warning(f"Could not load the underlying price for {symbol}. Try again shortly.")
+            return
+
+        def fetch_expiry(expiry: str) -> List[OptionQuote]:
+            return fetch_fn(
+                symbol,
+                expiry,
+                underlying_price=underlying_price,
+                expiry_dt=expiry_dates[expiry],
+                days_to_expiry=days_by_expiry[expiry],
+            )
+
+        with ThreadPoolExecutor(max_workers=min(8, len(selected_expiries))) as executor:
+            quotes_by_expiry = dict(
+                zip(selected_expiries, executor.map(fetch_expiry, selected_expiries))
+            )
 
     if not any(quotes_by_expiry.values()):
         st.warning("No option quotes available for the selected expiries.")
         return
 
-    first_quotes = next((quotes for quotes in quotes_by_expiry.values() if quotes), [])
-    underlying_price = first_quotes[0].underlying_price if first_quotes else None
-
-    if underlying_price is not None:
-        st.metric("Underlying Price", f"${underlying_price:,.2f}")
-        if strategy == "Covered Call":
-            apr_caption = "APR = (premium / underlying price) * (365 / days to expiry)."
-        else:
-            apr_caption = "APR = (premium / strike price) * (365 / days to expiry)."
-        st.caption(apr_caption)
+    st.metric("Underlying Price", f"${underlying_price:,.2f}")
+    if strategy == "Covered Call":
+        apr_caption = "APR = (premium / underlying price) * (365 / days to expiry)."
+    else:
+        apr_caption = "APR = (premium / strike price) * (365 / days to expiry)."
+    st.caption(apr_caption)
 
     display_columns = [
         "Strike ($)",
@@ -145,19 +172,25 @@ def main() -> None:
             continue
 
         df = quotes_to_dataframe(quotes)
-        df["APR (%)"] = df["apr"].round(2)
-        df["Premium ($)"] = df["premium"].round(2)
-        df["Strike ($)"] = df.apply(
-            lambda row: format_strike_with_percent(row["strike"], row.get("underlying_price")),
-            axis=1,
+        days_to_expiry = int(df["days_to_expiry"].iloc[0])
+        # Only the displayed rows need formatted columns.
+        top = df.nlargest(int(top_n), "apr")
+        strike_pct = (top["strike"] - top["underlying_price"]) / top["underlying_price"] * 100
+        top = top.assign(
+            **{
+                "APR (%)": top["apr"].round(2),
+                "Premium ($)": top["premium"].round(2),
+                "Strike ($)": [
+                    f"{strike:.2f} ({pct:.2f}%)"
+                    for strike, pct in zip(top["strike"].to_numpy(), strike_pct.to_numpy())
+                ],
+                "Days to Expiry": top["days_to_expiry"].astype(int),
+            }
         )
-        df["Days to Expiry"] = df["days_to_expiry"].astype(int)
-        days_to_expiry = int(df["Days to Expiry"].iloc[0])
-        df = df.sort_values("APR (%)", ascending=False)
 
-        available_columns = [c for c in display_columns if c in df.columns]
+        available_columns = [c for c in display_columns if c in top.columns]
         st.markdown(f"**{strategy} - Expiry: {expiry} - {days_to_expiry} days remaining**")
-        st.dataframe(df[available_columns].head(top_n))
+        st.dataframe(top[available_columns])
         if stats:
             caption = (
                 f"Diagnostics — total: {stats.get('total_rows', 0)}, "
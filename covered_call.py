@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import functools
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
+try:
+    import streamlit as st
+except ImportError:  # Streamlit is only needed for the app's caching layer.
+    st = None
+
 logger = logging.getLogger(__name__)
 if not logger.handlers:
     handler = logging.StreamHandler()
@@ -17,10 +25,19 @@ if not logger.handlers:
 logger.setLevel(logging.INFO)
 
 StatsDict = Dict[str, Any]
+F = TypeVar("F", bound=Callable[..., Any])
 _FETCH_STATS: Dict[Tuple[str, str, str], StatsDict] = {}
 
 
-@dataclass
+def _cache_data(**kwargs: Any) -> Callable[[F], F]:
+    """Apply ``st.cache_data`` when Streamlit is installed, otherwise leave the function as is."""
+    if st is None:
+        return lambda func: func
+    return st.cache_data(**kwargs)
+
+
+# slots=True requires Python 3.10+; see requirements.txt.
+@dataclass(slots=True, frozen=True)
 class OptionQuote:
     ticker: str
     option_type: str
@@ -55,21 +72,48 @@ def _get_underlying_price(ticker: yf.Ticker) -> Optional[float]:
     return None
 
 
-def _calculate_premium(row: pd.Series) -> Optional[float]:
-    """Use the bid price as the option premium."""
-    bid = row.get("bid")
-    if bid is not None and not pd.isna(bid) and bid > 0:
-        return float(bid)
+@functools.lru_cache(maxsize=256)
+def _get_underlying_price_cached(symbol: str, bucket: int) -> float:
+    """
+    Memoize ``_get_underlying_price`` per symbol; ``bucket`` is the current minute.
+    Raises ``ValueError`` when no price is found so that failures are never memoized.
+    """
+    price = _get_underlying_price(yf.Ticker(symbol))
+    if price is None:
+        raise ValueError(f"No underlying price for {symbol}")
+    return price
 
-    last_price = row.get("lastPrice")
-    if last_price is not None and not pd.isna(last_price) and last_price > 0:
-        return float(last_price)
 
-    ask = row.get("ask")
-    if ask is not None and not pd.isna(ask) and ask > 0:
-        return float(ask)
+def fetch_underlying_price(symbol: str) -> Optional[float]:
+    """Return the underlying price for ``symbol``, shared by all callers within a minute."""
+    try:
+        return _get_underlying_price_cached(symbol, int(time.time() // 60))
+    except ValueError:
+        return None
+
+
+@_cache_data(ttl=60, show_spinner=False)
+def _cached_option_chain(symbol: str, expiry: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Return the (calls, puts) tables for ``symbol`` and ``expiry``, memoized for 60 seconds.
+    Both fetchers read from this one download, so switching strategy reuses the chain.
+    """
+    option_chain = yf.Ticker(symbol).option_chain(expiry)
+    return option_chain.calls.reset_index(drop=True), option_chain.puts.reset_index(drop=True)
 
-    return None
+
+def _numeric_column(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Return a column as a float array, filled with NaN when missing or non-numeric."""
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype="float64")
+
+
+def _compute_premium(bid: np.ndarray, last_price: np.ndarray, ask: np.ndarray) -> np.ndarray:
+    """Use the bid as the premium, falling back to last price and then ask (NaN if none)."""
+    return np.where(
+        bid > 0, bid, np.where(last_price > 0, last_price, np.where(ask > 0, ask, np.nan))
+    )
 
 
 def _calculate_days_to_expiry(expiry: datetime) -> int:
@@ -86,7 +130,7 @@ def get_fetch_stats(symbol: str, expiry: str, option_type: str) -> StatsDict:
 
 
 def _init_stats(option_type: str, symbol: str, expiry: str) -> Tuple[Tuple[str, str, str], StatsDict]:
-    key = (option_type, symbol.upper(), expiry)
+    key = (option_type, symbol, expiry)
     stats: StatsDict = {
         "total_rows": 0,
         "kept": 0,
@@ -99,155 +143,210 @@ def _init_stats(option_type: str, symbol: str, expiry: str) -> Tuple[Tuple[str,
     return key, stats
 
 
-def fetch_covered_call_quotes(symbol: str, expiry: str) -> List[OptionQuote]:
+def fetch_covered_call_quotes(
+    symbol: str,
+    expiry: str,
+    *,
+    underlying_price: Optional[float] = None,
+    expiry_dt: Optional[datetime] = None,
+    days_to_expiry: Optional[int] = None,
+) -> List[OptionQuote]:
     """
     Fetch call options for the given symbol and expiry and compute covered call APR.
+    Pass ``underlying_price`` to reuse a price already fetched for other expiries, and
+    ``expiry_dt``/``days_to_expiry`` to skip re-parsing an expiry the caller already has.
+    Quotes are returned in option chain (strike) order, not sorted by APR.
     """
+    symbol = symbol.upper()
     key, stats = _init_stats("call", symbol, expiry)
 
-    ticker = yf.Ticker(symbol)
-    underlying_price = _get_underlying_price(ticker)
+    if underlying_price is None:
+        underlying_price = fetch_underlying_price(symbol)
     if underlying_price is None or underlying_price <= 0:
         stats["error"] = "missing_underlying_price"
         logger.info("No underlying price for %s", symbol)
         return []
 
     try:
-        option_chain = ticker.option_chain(expiry)
-        calls_df = option_chain.calls
-    except Exception as exc:
+        calls_df, _ = _cached_option_chain(symbol, expiry)
+    except Exception:
         stats["error"] = "option_chain_error"
         logger.exception("Failed to load call option chain for %s %s", symbol, expiry)
         return []
 
-    expiry_dt = datetime.strptime(expiry, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    days_to_expiry = _calculate_days_to_expiry(expiry_dt)
+    if expiry_dt is None:
+        expiry_dt = datetime.strptime(expiry, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    if days_to_expiry is None:
+        days_to_expiry = _calculate_days_to_expiry(expiry_dt)
     if days_to_expiry == 0:
         stats["error"] = "non_positive_days_to_expiry"
         logger.info("Covered call %s %s has non-positive days_to_expiry", symbol, expiry)
         return []
 
     stats["total_rows"] = len(calls_df)
-    results: List[OptionQuote] = []
-    for _, row in calls_df.iterrows():
-        premium = _calculate_premium(row)
-        if premium is None or premium <= 0:
-            stats["missing_bid"] += 1
-            continue
-
-        strike = float(row["strike"])
-        if strike <= underlying_price:
-            stats["not_otm"] += 1
-            continue
-
-        apr = (premium / underlying_price) * (365 / days_to_expiry) * 100
-        break_even = underlying_price - premium
-
-        results.append(
-            OptionQuote(
-                ticker=symbol.upper(),
-                option_type="call",
-                expiry=expiry_dt,
-                strike=strike,
-                premium=premium,
-                underlying_price=underlying_price,
-                days_to_expiry=days_to_expiry,
-                apr=apr,
-                break_even_price=break_even,
-                bid=row.get("bid"),
-                ask=row.get("ask"),
-                implied_vol=row.get("impliedVolatility"),
-            )
+    bid = _numeric_column(calls_df, "bid")
+    ask = _numeric_column(calls_df, "ask")
+    strike = _numeric_column(calls_df, "strike")
+    implied_vol = _numeric_column(calls_df, "impliedVolatility")
+    premium = _compute_premium(bid, _numeric_column(calls_df, "lastPrice"), ask)
+    has_premium = premium > 0
+    valid_strike = ~np.isnan(strike)
+    is_otm = strike > underlying_price
+    keep = has_premium & valid_strike & is_otm
+    stats["missing_bid"] = int((~has_premium).sum())
+    stats["invalid_strike"] = int((has_premium & ~valid_strike).sum())
+    stats["not_otm"] = int((has_premium & valid_strike & ~is_otm).sum())
+
+    premium = premium[keep]
+    strike = strike[keep]
+    bid, ask, implied_vol = bid[keep], ask[keep], implied_vol[keep]
+    apr = (premium / underlying_price) * (365 / days_to_expiry) * 100
+    break_even = underlying_price - premium
+
+    results: List[OptionQuote] = [
+        OptionQuote(
+            ticker=symbol,
+            option_type="call",
+            expiry=expiry_dt,
+            strike=row_strike,
+            premium=row_premium,
+            underlying_price=underlying_price,
+            days_to_expiry=days_to_expiry,
+            apr=row_apr,
+            break_even_price=row_break_even,
+            bid=row_bid,
+            ask=row_ask,
+            implied_vol=row_implied_vol,
         )
+        # tolist() converts to Python floats in one pass instead of per element.
+        for row_strike, row_premium, row_apr, row_break_even, row_bid, row_ask, row_implied_vol in zip(
+            strike.tolist(),
+            premium.tolist(),
+            apr.tolist(),
+            break_even.tolist(),
+            bid.tolist(),
+            ask.tolist(),
+            implied_vol.tolist(),
+        )
+    ]
 
     stats["kept"] = len(results)
     logger.info(
-        "Covered calls %s %s -> total=%s kept=%s missing_bid=%s not_otm=%s",
+        "Covered calls %s %s -> total=%s kept=%s missing_bid=%s not_otm=%s invalid_strike=%s",
         symbol,
         expiry,
         stats["total_rows"],
         stats["kept"],
         stats["missing_bid"],
         stats["not_otm"],
+        stats["invalid_strike"],
     )
     _FETCH_STATS[key] = stats
-    return sorted(results, key=lambda quote: quote.apr, reverse=True)
+    return results
+
+
+@_cache_data(ttl=300, show_spinner=False)
+def _cached_option_expiries(symbol: str) -> List[str]:
+    """Return expiry dates for ``symbol``; errors propagate so they are not cached."""
+    return list(yf.Ticker(symbol).options)
 
 
 def list_option_expiries(symbol: str) -> List[str]:
     """Return available expiry dates for the given symbol."""
-    ticker = yf.Ticker(symbol)
     try:
-        return list(ticker.options)
+        return _cached_option_expiries(symbol)
     except Exception:
         return []
 
 
-def fetch_cash_secured_put_quotes(symbol: str, expiry: str) -> List[OptionQuote]:
+def fetch_cash_secured_put_quotes(
+    symbol: str,
+    expiry: str,
+    *,
+    underlying_price: Optional[float] = None,
+    expiry_dt: Optional[datetime] = None,
+    days_to_expiry: Optional[int] = None,
+) -> List[OptionQuote]:
     """
     Fetch put options for the given symbol and expiry and compute cash-secured put APR.
     APR is calculated as (premium / strike) annualized.
+    Pass ``underlying_price`` to reuse a price already fetched for other expiries, and
+    ``expiry_dt``/``days_to_expiry`` to skip re-parsing an expiry the caller already has.
+    Quotes are returned in option chain (strike) order, not sorted by APR.
     """
+    symbol = symbol.upper()
     key, stats = _init_stats("put", symbol, expiry)
 
-    ticker = yf.Ticker(symbol)
-    underlying_price = _get_underlying_price(ticker)
+    if underlying_price is None:
+        underlying_price = fetch_underlying_price(symbol)
     if underlying_price is None or underlying_price <= 0:
         stats["error"] = "missing_underlying_price"
         logger.info("No underlying price for %s", symbol)
         return []
 
     try:
-        option_chain = ticker.option_chain(expiry)
-        puts_df = option_chain.puts
+        _, puts_df = _cached_option_chain(symbol, expiry)
     except Exception:
         stats["error"] = "option_chain_error"
         logger.exception("Failed to load put option chain for %s %s", symbol, expiry)
         return []
 
-    expiry_dt = datetime.strptime(expiry, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    days_to_expiry = _calculate_days_to_expiry(expiry_dt)
+    if expiry_dt is None:
+        expiry_dt = datetime.strptime(expiry, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    if days_to_expiry is None:
+        days_to_expiry = _calculate_days_to_expiry(expiry_dt)
     if days_to_expiry == 0:
         stats["error"] = "non_positive_days_to_expiry"
         logger.info("Cash-secured put %s %s has non-positive days_to_expiry", symbol, expiry)
         return []
 
     stats["total_rows"] = len(puts_df)
-    results: List[OptionQuote] = []
-    for _, row in puts_df.iterrows():
-        premium = _calculate_premium(row)
-        if premium is None or premium <= 0:
-            stats["missing_bid"] += 1
-            continue
-
-        strike = float(row["strike"])
-        if strike >= underlying_price:
-            stats["not_otm"] += 1
-            continue
-
-        if strike <= 0:
-            stats["invalid_strike"] += 1
-            continue
-
-        apr = (premium / strike) * (365 / days_to_expiry) * 100
-        break_even = strike - premium
-
-        results.append(
-            OptionQuote(
-                ticker=symbol.upper(),
-                option_type="put",
-                expiry=expiry_dt,
-                strike=strike,
-                premium=premium,
-                underlying_price=underlying_price,
-                days_to_expiry=days_to_expiry,
-                apr=apr,
-                break_even_price=break_even,
-                bid=row.get("bid"),
-                ask=row.get("ask"),
-                implied_vol=row.get("impliedVolatility"),
-            )
+    bid = _numeric_column(puts_df, "bid")
+    ask = _numeric_column(puts_df, "ask")
+    strike = _numeric_column(puts_df, "strike")
+    implied_vol = _numeric_column(puts_df, "impliedVolatility")
+    premium = _compute_premium(bid, _numeric_column(puts_df, "lastPrice"), ask)
+    has_premium = premium > 0
+    # NaN strikes fail both comparisons; count them as invalid rather than not OTM.
+    is_otm = strike < underlying_price
+    valid_strike = strike > 0
+    keep = has_premium & is_otm & valid_strike
+    stats["missing_bid"] = int((~has_premium).sum())
+    stats["not_otm"] = int((has_premium & ~is_otm & ~np.isnan(strike)).sum())
+    stats["invalid_strike"] = int((has_premium & ~valid_strike).sum())
+
+    premium = premium[keep]
+    strike = strike[keep]
+    bid, ask, implied_vol = bid[keep], ask[keep], implied_vol[keep]
+    apr = (premium / strike) * (365 / days_to_expiry) * 100
+    break_even = strike - premium
+
+    results: List[OptionQuote] = [
+        OptionQuote(
+            ticker=symbol,
+            option_type="put",
+            expiry=expiry_dt,
+            strike=row_strike,
+            premium=row_premium,
+            underlying_price=underlying_price,
+            days_to_expiry=days_to_expiry,
+            apr=row_apr,
+            break_even_price=row_break_even,
+            bid=row_bid,
+            ask=row_ask,
+            implied_vol=row_implied_vol,
+        )
+        # tolist() converts to Python floats in one pass instead of per element.
+        for row_strike, row_premium, row_apr, row_break_even, row_bid, row_ask, row_implied_vol in zip(
+            strike.tolist(),
+            premium.tolist(),
+            apr.tolist(),
+            break_even.tolist(),
+            bid.tolist(),
+            ask.tolist(),
+            implied_vol.tolist(),
         )
+    ]
 
     stats["kept"] = len(results)
     logger.info(
@@ -261,4 +360,4 @@ def fetch_cash_secured_put_quotes(symbol: str, expiry: str) -> List[OptionQuote]
         stats["invalid_strike"],
     )
     _FETCH_STATS[key] = stats
-    return sorted(results, key=lambda quote: quote.apr, reverse=True)
+    return results